@@ -61,6 +61,34 @@ def read_csv(file):
         raise
 
 
+def read_csv_bytes(file):
+    """
+    Function to read in a CSV file and return its hashes packed into a numpy array
+
+    Intended for very large inputs: each 64-char hex hash becomes 32 raw bytes in
+    one contiguous buffer, collapsing the per-string Python object overhead of
+    read_csv. Requires numpy, which is an optional dependency.
+
+    Args:
+        file (TextIOWrapper): The file given as input to the function
+
+    Raises:
+        AssertionError: incorrect length of a hash, or empty file
+        OSError: File could not be found or read
+        ValueError: a hash is not valid hexadecimal
+        ImportError: numpy is not installed
+
+    Returns:
+        numpy.ndarray: One 32-byte (void dtype) entry per hash.
+
+    """
+    import numpy as np
+
+    hashes = read_csv(file)
+    buffer = b"".join(bytes.fromhex(hash_val) for hash_val in hashes)
+    return np.frombuffer(buffer, dtype="V32")
+
+
 def read_json(json_string):
     """
     Function to read in a JSON string and return a JSON object of hashes
@@ -16,6 +16,9 @@ Binary analysis sdk for managing and submitting hashes
 
 Model for the configuration data.
 """
+import os
+import pickle
+
 import yaml
 from .errors import ConfigError
 
@@ -64,6 +67,11 @@ class Config:
         """
         Load a YAML file into a Config object.
 
+        The parsed data is cached in a pickle file next to the YAML and reused on
+        later loads while the YAML is unchanged (by modification time), since YAML
+        parsing dominates startup cost for repeated CLI invocations. Cache misses,
+        corruption, or unwritable locations all fall back to parsing the YAML.
+
         Args:
             filename (str): The name of the file to be loaded.
 
@@ -71,8 +79,23 @@ class Config:
             (Config): The Config object that contains the data in the config file.
 
         """
+        cache_name = filename + '.pkl'
+        try:
+            if os.path.getmtime(cache_name) >= os.path.getmtime(filename):
+                with open(cache_name, 'rb') as cache_file:
+                    return Config(pickle.load(cache_file))
+        except (OSError, pickle.PickleError, EOFError):
+            pass
+
         with open(filename, 'r') as file:
-            return Config.load(file)
+            config = Config.load(file)
+
+        try:
+            with open(cache_name, 'wb') as cache_file:
+                pickle.dump(config._data, cache_file)
+        except OSError:
+            pass
+        return config
 
     def _seek_path(self, path, suppress_exceptions=False):
         """
@@ -33,7 +33,8 @@ class DeduplicationComponent:
         Remove hashes from the input that have already been processed, as determined by the state manager.
 
         Args:
-            list_input (list): List of hashes to be processed (coming from command line input)
+            list_input (iterable): Hashes to be processed (coming from command line input).
+                May be any iterable; it is consumed in a single streaming pass.
 
         Returns:
             list: Another list of hashes, with all the hashes that have already been processed
@@ -44,6 +45,56 @@ class DeduplicationComponent:
         engine_name = self._config.string("engine.name")
         # Use simple set-difference implementation unless we need to implement something more powerful,
         # like merge-join technique
-        input_set = {item.casefold() for item in list_input}
-        existset = set(self._state_manager.get_previous_hashes(engine_name))
-        return list(input_set - existset)
+        existset = {self._dedup_key(item) for item in self._state_manager.get_previous_hashes(engine_name)}
+        return_list = []
+        for item in list_input:
+            item = item.casefold()
+            key = self._dedup_key(item)
+            if key not in existset:
+                existset.add(key)
+                return_list.append(item)
+        return return_list
+
+    @staticmethod
+    def deduplicate_bytes(hash_array):
+        """
+        Remove duplicate entries from a packed array of raw sha256 bytes.
+
+        Companion to cli_input.read_csv_bytes for very large inputs: numpy's C-level
+        sort dedups the 32-byte records without materializing per-hash Python
+        objects. This only removes duplicates within the input; filtering out
+        previously-processed hashes remains the job of deduplicate, the state-aware
+        entry point.
+
+        Args:
+            hash_array (numpy.ndarray): Packed 32-byte (void dtype) hash entries.
+
+        Returns:
+            numpy.ndarray: The unique entries, in sorted order.
+
+        """
+        import numpy as np
+
+        return np.unique(hash_array)
+
+    @staticmethod
+    def _dedup_key(hash):
+        """
+        Returns a compact set key for a hash value.
+
+        The first 64 bits of a sha256 are already uniformly distributed, so an 8-byte
+        int key dedups as reliably as the full 64-char string (birthday-bound collision
+        odds only become relevant around 2^32 entries) at a fraction of the hashing and
+        memory cost. Values that aren't hex fall back to the string itself.
+
+        Args:
+            hash (str): The hash value to build a key for.
+
+        Returns:
+            int or str: The key to use for set membership.
+
+        """
+        try:
+            return int(hash[:16], 16)
+        except ValueError:
+            return hash
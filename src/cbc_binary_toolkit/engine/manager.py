@@ -13,15 +13,33 @@
 
 """Local analysis engine manager"""
 
+import atexit
+import copy
 import logging
 
+from collections import defaultdict, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from schema import SchemaError
 from cbc_binary_toolkit import InitializationError
 from cbc_binary_toolkit.loader import dynamic_create
-from cbc_binary_toolkit.schemas import BinaryMetadataSchema
+from cbc_binary_toolkit.schemas import BinaryMetadataSchema, validate_binary_metadata
 
 log = logging.getLogger(__name__)
 
+# Per-process engine used by process pool workers
+_worker_engine = None
+
+
+def _process_pool_init(engine_factory, engine_config):
+    """Builds the engine for a process pool worker"""
+    global _worker_engine
+    _worker_engine = engine_factory.create_engine(engine_config)
+
+
+def _process_pool_analyze(binary_metadata):
+    """Runs one analysis on the worker's engine"""
+    return _worker_engine.analyze(binary_metadata)
+
 
 class LocalEngineFactory():
     """Abstract base class that should be inherited by Engine Factory objects."""
@@ -42,8 +60,17 @@ class LocalEngineManager():
 
     Initializes and manages the threaded analysis engines
 
+    Attributes:
+        VALIDATION_CACHE_SIZE (int): Maximum number of validated metadata dicts
+            remembered to skip re-validation of repeated hashes.
+        RESPONSE_CACHE_SIZE (int): Maximum number of engine responses remembered
+            per engine to skip re-analysis of repeated hashes.
+
     """
 
+    VALIDATION_CACHE_SIZE = 4096
+    RESPONSE_CACHE_SIZE = 4096
+
     def __init__(self, config):
         """Constructor"""
         self.config = config
@@ -51,22 +78,197 @@ class LocalEngineManager():
         if self.config.get("engine.type") != 'local':
             raise InitializationError
         self.engine_factory = dynamic_create(self.config.string("engine._provider"))
-        self.engine = self.engine_factory.create_engine(self.config.section("engine"))
+        self._engine_section = self.config.section("engine")
+        self.engine = self.engine_factory.create_engine(self._engine_section)
+        self._engine_name = self.engine.name
+        self._valid_cache = OrderedDict()
+        self._resp_cache = defaultdict(OrderedDict)
+        self._pool_size = self.config.get("engine.num_processes", 0)
+        self._pool = None
+
+    def shutdown(self):
+        """Shuts down the process pool, if one was created."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _get_pool(self):
+        """
+        Returns the process pool, creating it on first use.
+
+        The pool is kept for the manager's lifetime so worker startup (fork plus
+        engine construction, e.g. compiling rule sets) is paid once rather than
+        on every batch. It is torn down by shutdown or at interpreter exit.
+
+        Returns:
+            ProcessPoolExecutor: The shared process pool.
+
+        """
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self._pool_size,
+                                             initializer=_process_pool_init,
+                                             initargs=(self.engine_factory, self._engine_section))
+            atexit.register(self._pool.shutdown)
+        return self._pool
 
     def create_engine(self):
-        """Creates engine"""
-        return self.engine_factory.create_engine(self.config.section("engine"))
+        """Returns the engine built at construction time"""
+        return self.engine
 
     def analyze(self, binary_metadata):
         """Sends HashMetadata to engine"""
         try:
-            valid_metadata = BinaryMetadataSchema.validate(binary_metadata)
-            return self.engine.analyze(valid_metadata)
+            valid_metadata = self._validate_metadata(binary_metadata)
+            return self._dispatch(valid_metadata)
         except SchemaError as e:
-            log.error(f"Invalid schema for binary_metadata: {e}")
-            return {
-                "iocs": [],
-                "engine_name": self.engine.name,
-                "binary_hash": binary_metadata.get("sha256", None) if isinstance(binary_metadata, dict) else None,
-                "success": False
-            }
+            log.error("Invalid schema for binary_metadata: %s", e)
+            try:
+                binary_hash = binary_metadata.get("sha256", None)
+            except AttributeError:
+                binary_hash = None
+            return self._error_response(binary_hash)
+
+    def _dispatch(self, valid_metadata):
+        """
+        Sends validated HashMetadata to the engine, reusing cached responses.
+
+        Repeated analysis of the same binary by the same engine yields the same
+        IOCs, so successful responses are cached per (engine, sha256) and repeat
+        hashes skip the engine entirely. Hits return a copy, since downstream
+        report handling mutates the IOC dicts it accepts.
+
+        Args:
+            valid_metadata (dict): HashMetadata that has already been validated.
+
+        Returns:
+            dict: The engine response.
+
+        """
+        binary_hash = valid_metadata.get("sha256")
+        engine_cache = self._resp_cache[self._engine_name]
+        cached = engine_cache.get(binary_hash)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        response = self.engine.analyze(valid_metadata)
+        if binary_hash is not None and isinstance(response, dict) and response.get("success"):
+            engine_cache[binary_hash] = copy.deepcopy(response)
+            if len(engine_cache) > self.RESPONSE_CACHE_SIZE:
+                engine_cache.popitem(last=False)
+        return response
+
+    def _error_response(self, binary_hash):
+        """Builds the failure response returned when metadata does not validate"""
+        return {
+            "iocs": [],
+            "engine_name": self._engine_name,
+            "binary_hash": binary_hash,
+            "success": False
+        }
+
+    def analyze_batch(self, metadata_list):
+        """
+        Sends a list of HashMetadata to the engine in a single pass.
+
+        Metadata matching the expected shape is dispatched directly to the engine,
+        skipping per-item schema dispatch; anything that fails the cheap check goes
+        through the full validation in analyze so errors are reported identically.
+
+        When engine.num_processes is set above 1, analysis fans out over a process
+        pool for engines that are CPU bound (such as YARA rule matching).
+
+        Args:
+            metadata_list (list): List of HashMetadata dicts to be analyzed.
+
+        Returns:
+            list: Engine responses, one per metadata item, in input order.
+
+        """
+        if self._pool_size > 1 and len(metadata_list) > 1:
+            return self._analyze_batch_pooled(metadata_list)
+
+        dispatch = self._dispatch
+        return [dispatch(metadata) if self._quick_check(metadata) else self.analyze(metadata)
+                for metadata in metadata_list]
+
+    def _analyze_batch_pooled(self, metadata_list):
+        """
+        Fans a metadata batch out over the shared process pool.
+
+        Each worker builds its own engine from the factory and the engine config
+        section, since engines (compiled rule sets, open handles) generally do not
+        pickle. The pool is reused across batches, so small batches do not pay
+        worker startup costs again.
+
+        Args:
+            metadata_list (list): List of HashMetadata dicts to be analyzed.
+
+        Returns:
+            list: Engine responses, one per metadata item, in input order.
+
+        """
+        responses = [None] * len(metadata_list)
+        pending = []
+        for index, metadata in enumerate(metadata_list):
+            if self._quick_check(metadata):
+                pending.append((index, metadata))
+            else:
+                try:
+                    pending.append((index, self._validate_metadata(metadata)))
+                except SchemaError:
+                    # analyze re-runs validation and produces the error response
+                    responses[index] = self.analyze(metadata)
+
+        if pending:
+            results = self._get_pool().map(_process_pool_analyze,
+                                           [metadata for _, metadata in pending],
+                                           chunksize=8)
+            for (index, _), response in zip(pending, results):
+                responses[index] = response
+        return responses
+
+    def _validate_metadata(self, binary_metadata):
+        """
+        Validates HashMetadata against BinaryMetadataSchema, memoizing by sha256.
+
+        Repeated validations of identical metadata (retries, restarts, duplicates
+        surviving dedup) become a dict lookup plus an equality check instead of a
+        full per-field schema traversal.
+
+        Args:
+            binary_metadata (dict): HashMetadata to be validated.
+
+        Returns:
+            dict: The validated metadata.
+
+        Raises:
+            SchemaError: If the metadata does not conform to BinaryMetadataSchema.
+
+        """
+        key = binary_metadata.get("sha256") if isinstance(binary_metadata, dict) else None
+        if not isinstance(key, str):
+            # Anything but a string (including unhashable values) is a cache miss;
+            # validation below produces the schema error for the bad metadata
+            key = None
+        if key is not None:
+            cached = self._valid_cache.get(key)
+            if cached is not None and cached == binary_metadata:
+                self._valid_cache.move_to_end(key)
+                return cached
+
+        try:
+            valid_metadata = validate_binary_metadata(binary_metadata)
+        except SchemaError:
+            # Re-validate with the schema library for the authoritative error
+            valid_metadata = BinaryMetadataSchema.validate(binary_metadata)
+        if key is not None:
+            self._valid_cache[key] = valid_metadata
+            if len(self._valid_cache) > self.VALIDATION_CACHE_SIZE:
+                self._valid_cache.popitem(last=False)
+        return valid_metadata
+
+    @staticmethod
+    def _quick_check(binary_metadata):
+        """Cheap structural check for the common, well-formed metadata shape"""
+        sha256 = binary_metadata.get("sha256") if isinstance(binary_metadata, dict) else None
+        return isinstance(sha256, str) and len(sha256) == 64
@@ -189,6 +189,32 @@ class EngineResults:
             log.error("Validation of Analysis Engine Response failed.")
         return False
 
+    def receive_responses_bulk(self, engine_responses):
+        """
+        Processes a batch of engine responses inside a single state manager bulk update.
+
+        Equivalent to calling receive_response for each item, but the state writes
+        (report items and checkpoint updates) are committed once per batch rather
+        than once per write.
+
+        Args:
+            engine_responses (list): EngineResponseSchema dicts from the engine.
+
+        Returns:
+            bool: True if every response was validated, accepted, and had state updated,
+                  False otherwise
+
+        """
+        success = True
+        self.state_manager.begin_bulk()
+        try:
+            for engine_response in engine_responses:
+                if not self.receive_response(engine_response):
+                    success = False
+        finally:
+            self.state_manager.end_bulk()
+        return success
+
     def _send_reports(self, feed_id):
         """
         Sends IOCs in stored list to Carbon Black Cloud feed, specified by `feed_id`
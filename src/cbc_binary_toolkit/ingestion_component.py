@@ -14,8 +14,8 @@
 """Base for ingestion component"""
 
 import logging
-import copy
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from .ubs import download_hashes, get_metadata
 
@@ -38,9 +38,15 @@ class IngestionComponent:
     Attributes:
         DEFAULT_EXPIRATION (int): How long generated binary AWS download links
             will stay valid, in seconds.
+        DOWNLOAD_BATCH_SIZE (int): How many hashes are sent to the Unified Binary
+            Store file download route in a single request.
+        DEFAULT_CONCURRENCY (int): How many metadata requests are made in parallel,
+            unless overridden by the carbonblackcloud.concurrency configuration value.
 
     """
     DEFAULT_EXPIRATION = 3600
+    DOWNLOAD_BATCH_SIZE = 100
+    DEFAULT_CONCURRENCY = 8
 
     def __init__(self, config, cb_threat_hunter, state_manager):
         """Constructor"""
@@ -64,6 +70,52 @@ class IngestionComponent:
                 unfinished_hashes.append(state[0])
         return self.fetch_metadata(unfinished_hashes)
 
+    def iter_metadata(self, hashes):
+        """
+        Fetches metadata for the binaries, yielding it as each download batch completes.
+
+        A lazy version of fetch_metadata: consumers can start analyzing binaries from
+        the first batch while later batches are still being fetched.
+
+        Args:
+            hashes (list): list of hashes to fetch
+
+        Yields:
+            dict: Hash metadata, in the same shape as the fetch_metadata return entries.
+
+        """
+        engine_name = self.config.string("engine.name")
+        expiration_seconds = self.config.get("carbonblackcloud.expiration_seconds", self.DEFAULT_EXPIRATION)
+        max_workers = self.config.get("carbonblackcloud.concurrency", self.DEFAULT_CONCURRENCY)
+
+        for start in range(0, len(hashes), self.DOWNLOAD_BATCH_SIZE):
+            # Fetch download url from UBS, one full batch per request
+            found = download_hashes(self.cb_threat_hunter,
+                                    hashes[start:start + self.DOWNLOAD_BATCH_SIZE],
+                                    expiration_seconds)
+            if not found:
+                continue
+
+            # Fetch metadata from UBS; the per-hash requests are network bound, so they
+            # overlap on a thread pool while state updates stay on the calling thread
+            if len(found) > 1 and max_workers > 1:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    metadata_results = list(executor.map(
+                        lambda download_data: get_metadata(self.cb_threat_hunter, download_data), found))
+            else:
+                metadata_results = [get_metadata(self.cb_threat_hunter, download_data) for download_data in found]
+
+            for download_data, metadata in zip(found, metadata_results):
+                # Save hash entry to state manager
+                if metadata:
+                    self.state_manager.set_checkpoint(download_data["sha256"],
+                                                      engine_name,
+                                                      "INGESTED")
+                    yield metadata
+
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Ingested: %s", datetime.now())
+
     def fetch_metadata(self, hashes):
         """
         Fetches the metadata and url for the binary
@@ -103,29 +155,4 @@ class IngestionComponent:
             ]
 
         """
-        found = list()
-        hashes_copy = copy.deepcopy(hashes)
-        # Fetch download url from UBS
-        while hashes_copy != []:
-            found.extend(download_hashes(self.cb_threat_hunter,
-                                         hashes_copy[:100],
-                                         self.config.get("carbonblackcloud.expiration_seconds",
-                                                         self.DEFAULT_EXPIRATION)))
-            del hashes_copy[:100]
-
-        engine_name = self.config.string("engine.name")
-        fetched_metadata = list()
-
-        # Fetch metadata from UBS
-        for download_data in found:
-            metadata = get_metadata(self.cb_threat_hunter, download_data)
-
-            # Save hash entry to state manager
-            if metadata:
-                self.state_manager.set_checkpoint(download_data["sha256"],
-                                                  engine_name,
-                                                  "INGESTED")
-                fetched_metadata.append(metadata)
-
-        log.debug(f"Ingested: {datetime.now()}")
-        return fetched_metadata
+        return list(self.iter_metadata(hashes))
@@ -13,7 +13,7 @@
 
 """Schemas for Engine Results component"""
 
-from schema import And, Or, Optional, Schema
+from schema import And, Or, Optional, Schema, SchemaError
 
 IOCv2SEVSchema = Schema(
     {
@@ -86,3 +86,66 @@ BinaryMetadataSchema = Schema(
         "trademark": Or(str, None)
     }
 )
+
+# Per-field check expressions used to generate the specialized validator below.
+# Must be kept in sync with BinaryMetadataSchema.
+_BINARY_METADATA_FIELD_CHECKS = {
+    "sha256": "isinstance(v, str) and len(v) == 64",
+    "url": "isinstance(v, str) and len(v)",
+    "architecture": "isinstance(v, list) and all(isinstance(i, str) for i in v)",
+    "available_file_size": "v is None or (isinstance(v, int) and not isinstance(v, bool))",
+    "charset_id": "v is None or (isinstance(v, int) and not isinstance(v, bool))",
+    "comments": "v is None or isinstance(v, str)",
+    "company_name": "v is None or isinstance(v, str)",
+    "copyright": "v is None or isinstance(v, str)",
+    "file_available": "isinstance(v, bool)",
+    "file_description": "v is None or isinstance(v, str)",
+    "file_size": "v is None or (isinstance(v, int) and not isinstance(v, bool))",
+    "file_version": "v is None or isinstance(v, str)",
+    "internal_name": "v is None or isinstance(v, str)",
+    "lang_id": "v is None or (isinstance(v, int) and not isinstance(v, bool))",
+    "md5": "isinstance(v, str) and len(v) == 32",
+    "original_filename": "v is None or isinstance(v, str)",
+    "os_type": "v is None or isinstance(v, str)",
+    "private_build": "v is None or isinstance(v, str)",
+    "product_description": "v is None or isinstance(v, str)",
+    "product_name": "v is None or isinstance(v, str)",
+    "product_version": "v is None or isinstance(v, str)",
+    "special_build": "v is None or isinstance(v, str)",
+    "trademark": "v is None or isinstance(v, str)"
+}
+
+
+def _compile_binary_metadata_validator():
+    """
+    Generates a validator function specialized to BinaryMetadataSchema.
+
+    The schema is fixed at import time, so a generated function with each field
+    check inlined as a straight-line statement avoids re-interpreting the schema
+    tree on every validate call. Failures raise SchemaError, like the schema
+    library itself.
+
+    Returns:
+        function: The generated validator; takes a metadata dict and returns it.
+
+    """
+    lines = [
+        "def _validate(m):",
+        "    if not isinstance(m, dict) or set(m) != _EXPECTED_KEYS:",
+        "        raise SchemaError('metadata keys do not match BinaryMetadataSchema', None)"
+    ]
+    for field, check in _BINARY_METADATA_FIELD_CHECKS.items():
+        lines.append(f"    v = m[{field!r}]")
+        lines.append(f"    if not ({check}):")
+        lines.append(f"        raise SchemaError('invalid value for key {field}', None)")
+    lines.append("    return m")
+
+    namespace = {
+        "SchemaError": SchemaError,
+        "_EXPECTED_KEYS": frozenset(_BINARY_METADATA_FIELD_CHECKS)
+    }
+    exec("\n".join(lines), namespace)
+    return namespace["_validate"]
+
+
+validate_binary_metadata = _compile_binary_metadata_validator()
@@ -29,12 +29,29 @@ class SQLiteBasedPersistor(BasePersistor):
         """Constructor"""
         self._conn = conn
         self._cursor_factory = sqlite3.Cursor
+        self._bulk_depth = 0
 
     def force_close(self):
         """Forces the persistor to close. This should only be called from test code."""
         self._conn.close()
         self._conn = None
 
+    def begin_bulk(self):
+        """Starts a bulk update; per-write commits are deferred until end_bulk."""
+        self._bulk_depth += 1
+
+    def end_bulk(self):
+        """Ends a bulk update, committing everything written since begin_bulk."""
+        if self._bulk_depth > 0:
+            self._bulk_depth -= 1
+            if self._bulk_depth == 0:
+                self._conn.commit()
+
+    def _commit(self):
+        """Commits written data, unless a bulk update is deferring commits."""
+        if self._bulk_depth == 0:
+            self._conn.commit()
+
     def set_checkpoint(self, binary_hash, engine_name, checkpoint_name, checkpoint_time=None):
         """
         Set a checkpoint on a binary hash/engine combination.
@@ -73,7 +90,7 @@ class SQLiteBasedPersistor(BasePersistor):
                         VALUES (?, ?, ?, datetime(?, 'utc'));
                     """
                     cursor.execute(stmt, (binary_hash, engine_name, checkpoint_name, checkpoint_time))
-            self._conn.commit()
+            self._commit()
         except sqlite3.OperationalError as e:
             log.error("OperationalError in set_checkpoint: %s" % (e,))
         finally:
@@ -174,7 +191,7 @@ class SQLiteBasedPersistor(BasePersistor):
                 VALUES (?, ?, ?);
             """
             cursor.execute(stmt, (severity, engine_name, json.dumps(data)))
-            self._conn.commit()
+            self._commit()
         except sqlite3.OperationalError as e:
             log.error("OperationalError in add_report_item: %s" % (e,))
         finally:
@@ -218,7 +235,7 @@ class SQLiteBasedPersistor(BasePersistor):
             cursor = self._conn.cursor(self._cursor_factory)
             stmt = "DELETE FROM report_item WHERE severity = ? AND engine_name = ?;"
             cursor.execute(stmt, (severity, engine_name))
-            self._conn.commit()
+            self._commit()
         except sqlite3.OperationalError as e:
             log.error("OperationalError in clear_report_items: %s" % (e,))
         finally:
@@ -23,6 +23,19 @@ class BasePersistor:
         """Forces the persistor to close. This should only be called from test code."""
         pass
 
+    def begin_bulk(self):
+        """
+        Starts a bulk update. Persistors may defer committing writes until end_bulk.
+
+        The default implementation does nothing, so persistors without transaction
+        support behave exactly as before.
+        """
+        pass
+
+    def end_bulk(self):
+        """Ends a bulk update, flushing any writes deferred since begin_bulk."""
+        pass
+
     def set_checkpoint(self, binary_hash, engine_name, checkpoint_name, checkpoint_time=None):
         """
         Set a checkpoint on a binary hash/engine combination.
@@ -148,6 +161,14 @@ class StateManager:
         self._persistor.force_close()
         self._persistor = None
 
+    def begin_bulk(self):
+        """Starts a bulk update. The persistor may defer committing writes until end_bulk."""
+        self._persistor.begin_bulk()
+
+    def end_bulk(self):
+        """Ends a bulk update, flushing any writes deferred since begin_bulk."""
+        self._persistor.end_bulk()
+
     def set_checkpoint(self, binary_hash, engine_name, checkpoint_name, checkpoint_time=None):
         """
         Set a checkpoint on a binary hash/engine combination.
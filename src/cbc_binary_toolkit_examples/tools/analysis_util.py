@@ -18,9 +18,11 @@ This class performs binary analysis on a series of hashes passed in on the comma
 """
 
 import os
+import queue
 import sys
 import argparse
 import logging
+import threading
 import traceback
 
 from datetime import datetime
@@ -47,14 +49,21 @@ LOG_LEVELS = {
 
 log = logging.getLogger(__name__)
 
+# Upper bound on metadata items buffered between ingestion and analysis
+METADATA_QUEUE_SIZE = 256
+
 
 class AnalysisUtility:
     """The top level analysis utility class. This is intended as an example which can be modified as needed."""
+
+    __slots__ = ("default_install", "config", "cbapi", "_feed_id", "_parser")
+
     def __init__(self, default_install):
         """Constructor for the analysis utility class"""
         self.default_install = default_install
         self.config = None
         self.cbapi = None
+        self._feed_id = None
 
         # Create argument parser
         self._parser = argparse.ArgumentParser()
@@ -70,7 +79,8 @@ class AnalysisUtility:
         analyze_command = commands.add_parser("analyze", help="Analyze a list of hashes by command line or file")
         input_type = analyze_command.add_mutually_exclusive_group(required=True)
         input_type.add_argument("-l", "--list", type=str, help="List of hashes in JSON string format")
-        input_type.add_argument("-f", "--file", type=argparse.FileType('r'),
+        # Large hash files are read sequentially, so use a 1MB buffer to cut syscalls
+        input_type.add_argument("-f", "--file", type=argparse.FileType('r', 1 << 20),
                                 help="File of hashes in json or csv format")
 
         # Restart command parser
@@ -91,19 +101,37 @@ class AnalysisUtility:
             dict: A dict containing all the references to the top-level components.
 
         """
+        self._feed_id = self.config.get("engine.feed_id")
+
         try:
             state_manager = StateManager(self.config)
         except:
             log.error("Failed to create State Manager. Check your configuration")
             log.debug(traceback.format_exc())
-            state_manager = None
+            # No component can run without state management, so skip the
+            # network-touching setup (TLS session, engine rule compile) entirely
+            return {
+                "deduplicate": None,
+                "ingest": None,
+                "engine_manager": None,
+                "results_engine": None,
+                "state_manager": None,
+                "success": False
+            }
 
         cbth = self.cbapi
         if cbth is None:
+            # Size the HTTP connection pool to the threaded metadata fetch, so
+            # concurrent requests beyond the requests default of 10 do not pay
+            # a fresh TCP/TLS handshake each
+            pool_size = max(10, self.config.get("carbonblackcloud.concurrency",
+                                                IngestionComponent.DEFAULT_CONCURRENCY))
             cbth = CbThreatHunterAPI(url=self.config.get("carbonblackcloud.url"),
                                      org_key=self.config.get("carbonblackcloud.org_key"),
                                      token=self.config.get("carbonblackcloud.api_token"),
-                                     ssl_verify=self.config.get("carbonblackcloud.ssl_verify"))
+                                     ssl_verify=self.config.get("carbonblackcloud.ssl_verify"),
+                                     pool_connections=pool_size,
+                                     pool_maxsize=pool_size)
 
         deduplicate = DeduplicationComponent(self.config, state_manager)
         ingest = IngestionComponent(self.config, cbth, state_manager)
@@ -125,7 +153,7 @@ class AnalysisUtility:
             "engine_manager": engine_manager,
             "results_engine": results_engine,
             "state_manager": state_manager,
-            "success": True if state_manager is not None and engine_manager is not None else False
+            "success": engine_manager is not None
         }
 
     def _yes_or_no(self, question):
@@ -139,14 +167,13 @@ class AnalysisUtility:
             boolean: True if the user answered Yes, False if they answered No.
 
         """
-        reply = str(input(f"{question}: (y/n)")).lower().strip()
-        if reply[0] == 'y':
-            return True
-        if reply[0] == 'n':
-            return False
-        else:
+        while True:
+            reply = input(f"{question}: (y/n)").strip().lower()
+            if reply.startswith('y'):
+                return True
+            if reply.startswith('n'):
+                return False
             log.error("Invalid: please use y/n")
-            return self._yes_or_no(question)
 
     def _any_reports_present(self, state_manager):
         """
@@ -167,22 +194,90 @@ class AnalysisUtility:
 
     def _process_metadata(self, components, metadata_list):
         """
-        Analyze a list of metadata through the analysis engine and report on the results.
+        Analyze metadata through the analysis engine and report on the results.
 
-        The back end to the analyze and restart commands.
+        The back end to the analyze and restart commands. Ingestion runs on a
+        producer thread feeding a bounded queue, so network fetches overlap with
+        engine analysis instead of strictly preceding it.
 
         Args:
             components (dict): Dict containing all the component references as returned from _init_components.
-            metadata_list (list): List of metadata objects to be analyzed.
+            metadata_list (iterable): Metadata objects to be analyzed. May be a list
+                or a lazy iterable such as IngestionComponent.iter_metadata.
 
         """
-        for metadata in metadata_list:
-            response = components["engine_manager"].analyze(metadata)
-            components["results_engine"].receive_response(response)
+        work_queue = queue.Queue(maxsize=METADATA_QUEUE_SIZE)
+        sentinel = object()
+        producer_error = []
+
+        def _produce():
+            try:
+                for metadata in metadata_list:
+                    work_queue.put(metadata)
+            except Exception as error:
+                producer_error.append(error)
+            finally:
+                work_queue.put(sentinel)
+
+        producer = threading.Thread(target=_produce, daemon=True)
+        producer.start()
+
+        # Upstream dedup works on hash groups; duplicates introduced by fetch or
+        # reload are filtered here before hitting the engine
+        seen = set()
+        analyzed = 0
+        done = False
+        # Hoist the per-iteration lookups out of the dispatch loop
+        analyze_batch = components["engine_manager"].analyze_batch
+        receive_responses_bulk = components["results_engine"].receive_responses_bulk
+        try:
+            while not done:
+                metadata = work_queue.get()
+                if metadata is sentinel:
+                    done = True
+                    break
+
+                # Drain whatever else is already buffered so the engine gets a batch
+                batch = [metadata]
+                while True:
+                    try:
+                        metadata = work_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if metadata is sentinel:
+                        done = True
+                        break
+                    batch.append(metadata)
+
+                unique_metadata = []
+                for metadata in batch:
+                    hash = metadata.get("sha256") if isinstance(metadata, dict) else None
+                    # Non-string hashes skip dedup and reach the engine, which
+                    # reports the schema error for them
+                    if isinstance(hash, str):
+                        if hash in seen:
+                            continue
+                        seen.add(hash)
+                    unique_metadata.append(metadata)
+
+                receive_responses_bulk(analyze_batch(unique_metadata))
+                analyzed += len(unique_metadata)
+        finally:
+            # If analysis raised mid-stream, drain until the sentinel so the
+            # producer is not left blocked on a full queue, then wait for it to
+            # stop fetching and writing checkpoints before unwinding
+            while not done:
+                if work_queue.get() is sentinel:
+                    done = True
+            producer.join()
+        if producer_error:
+            raise producer_error[0]
+        if analyzed == 0:
+            log.info("No metadata to analyze")
 
         log.info('Analysis Completed')
-        if self.config.get("engine.feed_id"):
-            components["results_engine"].send_reports(self.config.get("engine.feed_id"))
+        if self._feed_id:
+            components["results_engine"].send_reports(self._feed_id)
         else:
             log.info("Feed publishing disabled. Specify a feed_id to enable")
 
@@ -200,13 +295,17 @@ class AnalysisUtility:
         else:
             hash_group = cli_input.read_json(args.list)
 
-        before = len(hash_group)
-        log.info("Checking for previously executed binaries")
-        hash_group = components["deduplicate"].deduplicate(hash_group)
-        if before > len(hash_group):
-            log.info(f"Found {before - len(hash_group)} binaries that have already been analyzed")
-
-        metadata_list = components["ingest"].fetch_metadata(hash_group)
+        # An empty input has nothing to deduplicate, so skip the state lookup;
+        # single hashes still go through dedup, as they may have been analyzed
+        # in a previous run
+        if hash_group:
+            before = len(hash_group)
+            log.info("Checking for previously executed binaries")
+            hash_group = components["deduplicate"].deduplicate(hash_group)
+            if before > len(hash_group):
+                log.info("Found %d binaries that have already been analyzed", before - len(hash_group))
+
+        metadata_list = components["ingest"].iter_metadata(hash_group)
         self._process_metadata(components, metadata_list)
 
     def _restart_command(self, components):
@@ -238,7 +337,7 @@ class AnalysisUtility:
         if args.log_level != "DEBUG":
             sys.tracebacklimit = 0
 
-        log.debug("Started: {}".format(datetime.now()))
+        log.debug("Started: %s", datetime.now())
 
         if args.command_name is None:
             print(
@@ -258,7 +357,7 @@ class AnalysisUtility:
                               "found and no alternative was specified")
                     return 1
                 else:
-                    log.info(f"Attempting to load config from {self.default_install}")
+                    log.info("Attempting to load config from %s", self.default_install)
                     self.config = Config.load_file(self.default_install)
 
             if args.command_name == "analyze":
@@ -296,7 +395,7 @@ class AnalysisUtility:
                     log.info("Restarting")
                     self._restart_command(components)
 
-            log.debug("Finished: {}".format(datetime.now()))
+            log.debug("Finished: %s", datetime.now())
             return 0
         except Exception:
             log.error(traceback.format_exc())
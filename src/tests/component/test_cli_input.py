@@ -16,7 +16,7 @@
 import pytest
 import os
 
-from cbc_binary_toolkit.cli_input import read_csv, read_json
+from cbc_binary_toolkit.cli_input import read_csv, read_csv_bytes, read_json
 from typing import List, Dict
 from json import JSONDecodeError
 
@@ -71,6 +71,19 @@ class TestInputFunctions():
             with open(attach_path(answer_file_path), 'r') as answer_file:
                 assert str(read_json(input_file.read().strip())) == answer_file.read().strip()
 
+    def test_csv_bytes(self, tmp_path):
+        """Unit testing read_csv_bytes function"""
+        pytest.importorskip("numpy")
+        hashes = ["aa" * 32, "bb" * 32]
+        input_path = str(tmp_path / "hashes.csv")
+        with open(input_path, 'w') as csv_file:
+            csv_file.write("\n".join(hashes))
+
+        hash_array = read_csv_bytes(open(input_path))
+        assert len(hash_array) == 2
+        assert bytes(hash_array[0]) == bytes.fromhex(hashes[0])
+        assert bytes(hash_array[1]) == bytes.fromhex(hashes[1])
+
     @pytest.mark.parametrize("error, input_file_path, msg", [
         (
             AssertionError,
@@ -13,6 +13,8 @@
 
 """Unit tests for the configuration code"""
 
+import os
+
 import pytest
 from cbc_binary_toolkit.config import Config
 from cbc_binary_toolkit.config.errors import ConfigError
@@ -103,3 +105,37 @@ def test_get():
     assert isinstance(cfg.get('pets.missing', True), bool)
     assert cfg.get('pets.missing', True) is True
     assert cfg.get('pets.missing') is None
+
+
+def test_load_file_caches_parsed_data(tmp_path):
+    """Test that load_file caches the parsed data and reuses it while the YAML is unchanged."""
+    filename = str(tmp_path / "config.yaml")
+    with open(filename, 'w') as file:
+        file.write("""
+        id: cbc_binary_toolkit
+        version: 0.0.1
+        pets:
+          dog: QBit
+        """)
+
+    cfg = Config.load_file(filename)
+    assert cfg.string('pets.dog') == "QBit"
+    assert os.path.exists(filename + '.pkl')
+
+    # Second load comes from the cache
+    cfg = Config.load_file(filename)
+    assert cfg.string('pets.dog') == "QBit"
+
+    # Touching the YAML invalidates the cache
+    later = os.path.getmtime(filename + '.pkl') + 10
+    os.utime(filename, (later, later))
+    with open(filename, 'w') as file:
+        file.write("""
+        id: cbc_binary_toolkit
+        version: 0.0.1
+        pets:
+          dog: Rex
+        """)
+    os.utime(filename, (later, later))
+    cfg = Config.load_file(filename)
+    assert cfg.string('pets.dog') == "Rex"
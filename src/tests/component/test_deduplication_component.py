@@ -72,3 +72,16 @@ def test_deduplication(local_config, input_list, previous_list, result_list):
     sut = DeduplicationComponent(local_config, state_manager)
     return_list = sut.deduplicate(input_list)
     assert equivalent(return_list, result_list), f"{return_list} != {result_list}"
+
+
+def test_deduplicate_bytes():
+    """Test the numpy-based dedup of packed hash bytes."""
+    np = pytest.importorskip("numpy")
+    buffer = bytes.fromhex("aa" * 32) + bytes.fromhex("bb" * 32) + bytes.fromhex("aa" * 32)
+    hash_array = np.frombuffer(buffer, dtype="V32")
+
+    unique_array = DeduplicationComponent.deduplicate_bytes(hash_array)
+
+    assert len(unique_array) == 2
+    assert bytes(unique_array[0]) == bytes.fromhex("aa" * 32)
+    assert bytes(unique_array[1]) == bytes.fromhex("bb" * 32)
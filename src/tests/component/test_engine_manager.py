@@ -21,7 +21,8 @@ from cbc_binary_toolkit.engine import LocalEngineManager
 from cbc_binary_toolkit.schemas import EngineResponseSchema
 
 from tests.component.engine_fixtures.mock_engine import MockLocalEngine
-from tests.component.schema_fixtures.mock_data import VALID_BINARY_METADATA, MISSING_FIELDS_BINARY_METADATA
+from tests.component.schema_fixtures.mock_data import (VALID_BINARY_METADATA, MISSING_FIELDS_BINARY_METADATA,
+                                                       INVALID_SHA256_BINARY_METADATA)
 
 ENGINE_NAME = "MockEngine"
 
@@ -56,6 +57,39 @@ def test_analyze(config):
     assert EngineResponseSchema.validate(manager.analyze(VALID_BINARY_METADATA))
 
 
+def test_analyze_batch_pooled():
+    """Test batch analyze fanned out over a process pool"""
+    config = Config.load(f"""
+    id: cbc_binary_toolkit
+    version: 0.0.1
+    engine:
+      name: {ENGINE_NAME}
+      type: local
+      num_processes: 2
+      _provider: tests.component.engine_fixtures.mock_engine.MockLocalEngineFactory
+      Test: TestPassed
+    """)
+    manager = LocalEngineManager(config)
+
+    responses = manager.analyze_batch([VALID_BINARY_METADATA, INVALID_SHA256_BINARY_METADATA, {}])
+    manager.shutdown()
+    assert len(responses) == 3
+    assert EngineResponseSchema.validate(responses[0])
+    assert not responses[1]["success"]
+    assert not responses[2]["success"]
+
+
+def test_analyze_batch(config):
+    """Test batch analyze pass through with valid and invalid metadata"""
+    manager = LocalEngineManager(config)
+
+    responses = manager.analyze_batch([VALID_BINARY_METADATA, INVALID_SHA256_BINARY_METADATA, {}])
+    assert len(responses) == 3
+    assert EngineResponseSchema.validate(responses[0])
+    assert not responses[1]["success"]
+    assert not responses[2]["success"]
+
+
 @pytest.mark.parametrize("input", [
     MISSING_FIELDS_BINARY_METADATA,
     {}
@@ -70,6 +104,14 @@ def test_analyze_invalid_schema(config, input):
     assert not result["success"]
 
 
+def test_analyze_unhashable_sha256(config):
+    """Test analyze with metadata whose sha256 cannot be used as a cache key"""
+    manager = LocalEngineManager(config)
+
+    result = manager.analyze({"sha256": ["not", "hashable"]})
+    assert not result["success"]
+
+
 @pytest.mark.parametrize("engine_config, exception", [
     ["""
         id: cbc_binary_toolkit
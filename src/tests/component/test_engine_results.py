@@ -245,6 +245,19 @@ def test_execution_fail(engine_results, engine_response):
     assert not engine_results.receive_response(engine_response)
 
 
+def test_execution_bulk(state_manager, engine_results):
+    """Test processing a batch of responses in one bulk state update."""
+    responses = [copy.deepcopy(MESSAGE_VALID), copy.deepcopy(MESSAGE_VALID_1), copy.deepcopy(MESSAGE_VALID_2)]
+    assert engine_results.receive_responses_bulk(responses)
+    assert state_manager.get_unfinished_hashes(ENGINE_NAME) == []
+
+
+def test_execution_bulk_fail(engine_results):
+    """Test that one invalid response fails the batch without aborting it."""
+    responses = [copy.deepcopy(MESSAGE_VALID), copy.deepcopy(MESSAGE_INVALID)]
+    assert not engine_results.receive_responses_bulk(responses)
+
+
 # ==================================== INTEGRATION TESTS BELOW ====================================
 
 
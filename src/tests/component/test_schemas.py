@@ -21,7 +21,8 @@ from cbc_binary_toolkit.schemas import (
     BinaryMetadataSchema,
     EngineResponseSchema,
     IOCv2SEVSchema,
-    ReportSchema
+    ReportSchema,
+    validate_binary_metadata
 )
 from tests.component.schema_fixtures.mock_data import (
     # BinaryMetadataSchema
@@ -70,6 +71,41 @@ def test_BinaryMetadataSchema_failure(input):
         BinaryMetadataSchema.validate(input)
 
 
+@pytest.mark.parametrize("input", [
+    VALID_BINARY_METADATA
+])
+def test_validate_binary_metadata(input):
+    """Test generated validator success"""
+    assert validate_binary_metadata(input) == input
+
+
+@pytest.mark.parametrize("input", [
+    INVALID_SHA256_BINARY_METADATA,
+    INVALID_MD5_BINARY_METADATA,
+    EMPTY_URL_BINARY_METADATA,
+    MISSING_FIELDS_BINARY_METADATA,
+    "NOT_A_DICT"
+])
+def test_validate_binary_metadata_failure(input):
+    """Test generated validator failure"""
+    with pytest.raises(SchemaError):
+        validate_binary_metadata(input)
+
+
+@pytest.mark.parametrize("field", [
+    "available_file_size",
+    "charset_id",
+    "file_size",
+    "lang_id"
+])
+def test_validate_binary_metadata_rejects_bool_ints(field):
+    """Test that the generated validator rejects bools for int fields, like the schema does"""
+    metadata = dict(VALID_BINARY_METADATA, **{field: True})
+    assert not BinaryMetadataSchema.is_valid(metadata)
+    with pytest.raises(SchemaError):
+        validate_binary_metadata(metadata)
+
+
 @pytest.mark.parametrize("input", [
     VALID_ENGINE_RESPONSE
 ])
@@ -17,6 +17,7 @@ import pytest
 import logging
 import copy
 import json
+import threading
 from argparse import Namespace
 from datetime import datetime, timedelta
 
@@ -158,6 +159,26 @@ def test_process_metadata(cbapi_mock, config):
     assert METADATA_VALID["sha256"] in components["state_manager"].get_previous_hashes(ENGINE_NAME)
 
 
+def test_process_metadata_engine_failure(cbapi_mock, config):
+    """Test that an engine failure mid-stream propagates without leaking the producer thread"""
+    sut = AnalysisUtility(None)
+    sut.config = config
+    sut.cbapi = cbapi_mock.api
+
+    components = sut._init_components()
+
+    def broken_analyze_batch(metadata_list):
+        raise RuntimeError("engine failure")
+    components["engine_manager"].analyze_batch = broken_analyze_batch
+
+    # More metadata than the queue holds, so the producer blocks on put mid-failure
+    metadata_stream = (dict(METADATA_VALID, sha256=f"{index:064d}") for index in range(600))
+    threads_before = threading.active_count()
+    with pytest.raises(RuntimeError):
+        sut._process_metadata(components, metadata_stream)
+    assert threading.active_count() == threads_before
+
+
 def test_analyze_command(cbapi_mock, config):
     """Test data flow through the components in the _analyze_command method"""
     sut = AnalysisUtility(None)